@@ -0,0 +1,27 @@
+"""add_audit_event_type_timestamp_index
+
+Revision ID: a8b6c7d9e0f1
+Revises: f7a5b6c8d9e0
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8b6c7d9e0f1'
+down_revision: Union[str, Sequence[str], None] = 'f7a5b6c8d9e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for event-type time-window scans (revocation dashboard)."""
+    op.create_index('ix_audit_log_event_type_timestamp', 'audit_log', ['event_type', 'timestamp'])
+
+
+def downgrade() -> None:
+    """Drop event type / timestamp index."""
+    op.drop_index('ix_audit_log_event_type_timestamp', table_name='audit_log')
@@ -0,0 +1,47 @@
+"""add_composite_lookup_indexes
+
+Revision ID: b3c1d2e4f5a6
+Revises: 88d93b9042c3
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c1d2e4f5a6'
+down_revision: Union[str, Sequence[str], None] = '88d93b9042c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite indexes for role-filtered list and relationship lookups."""
+    op.create_index(
+        'ix_prescriptions_patient_id_doctor_id', 'prescriptions', ['patient_id', 'doctor_id']
+    )
+    op.create_index(
+        'ix_prescriptions_doctor_id_date_issued', 'prescriptions', ['doctor_id', 'date_issued']
+    )
+    op.create_index(
+        'ix_dispensings_prescription_id_pharmacist_id',
+        'dispensings',
+        ['prescription_id', 'pharmacist_id'],
+    )
+    op.create_index(
+        'ix_dispensings_pharmacist_id_date_dispensed',
+        'dispensings',
+        ['pharmacist_id', 'date_dispensed'],
+    )
+    op.create_index('ix_audit_log_actor_id_timestamp', 'audit_log', ['actor_id', 'timestamp'])
+
+
+def downgrade() -> None:
+    """Drop composite lookup indexes."""
+    op.drop_index('ix_audit_log_actor_id_timestamp', table_name='audit_log')
+    op.drop_index('ix_dispensings_pharmacist_id_date_dispensed', table_name='dispensings')
+    op.drop_index('ix_dispensings_prescription_id_pharmacist_id', table_name='dispensings')
+    op.drop_index('ix_prescriptions_doctor_id_date_issued', table_name='prescriptions')
+    op.drop_index('ix_prescriptions_patient_id_doctor_id', table_name='prescriptions')
@@ -0,0 +1,29 @@
+"""add_prescription_patient_date_index
+
+Revision ID: c4d2e3f5a6b7
+Revises: b3c1d2e4f5a6
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d2e3f5a6b7'
+down_revision: Union[str, Sequence[str], None] = 'b3c1d2e4f5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for per-patient date-range prescription filters."""
+    op.create_index(
+        'ix_prescriptions_patient_id_date_issued', 'prescriptions', ['patient_id', 'date_issued']
+    )
+
+
+def downgrade() -> None:
+    """Drop per-patient date-range index."""
+    op.drop_index('ix_prescriptions_patient_id_date_issued', table_name='prescriptions')
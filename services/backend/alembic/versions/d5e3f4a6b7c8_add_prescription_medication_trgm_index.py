@@ -0,0 +1,38 @@
+"""add_prescription_medication_trgm_index
+
+Revision ID: d5e3f4a6b7c8
+Revises: c4d2e3f5a6b7
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e3f4a6b7c8'
+down_revision: Union[str, Sequence[str], None] = 'c4d2e3f5a6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add trigram index serving medication_name ILIKE '%...%' filters (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_prescriptions_medication_name_trgm',
+        'prescriptions',
+        ['medication_name'],
+        postgresql_using='gin',
+        postgresql_ops={'medication_name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Drop trigram index on medication_name (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_prescriptions_medication_name_trgm', table_name='prescriptions')
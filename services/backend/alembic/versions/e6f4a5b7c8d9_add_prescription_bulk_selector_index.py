@@ -0,0 +1,32 @@
+"""add_prescription_bulk_selector_index
+
+Revision ID: e6f4a5b7c8d9
+Revises: d5e3f4a6b7c8
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f4a5b7c8d9'
+down_revision: Union[str, Sequence[str], None] = 'd5e3f4a6b7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for the bulk-revocation selector (covering on PostgreSQL)."""
+    op.create_index(
+        'ix_prescriptions_patient_id_status_date_issued',
+        'prescriptions',
+        ['patient_id', 'status', 'date_issued'],
+        postgresql_include=['id', 'medication_name'],
+    )
+
+
+def downgrade() -> None:
+    """Drop bulk-revocation selector index."""
+    op.drop_index('ix_prescriptions_patient_id_status_date_issued', table_name='prescriptions')
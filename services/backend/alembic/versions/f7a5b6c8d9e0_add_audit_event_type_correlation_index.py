@@ -0,0 +1,29 @@
+"""add_audit_event_type_correlation_index
+
+Revision ID: f7a5b6c8d9e0
+Revises: e6f4a5b7c8d9
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a5b6c8d9e0'
+down_revision: Union[str, Sequence[str], None] = 'e6f4a5b7c8d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for schedule lookups by event type and correlation id."""
+    op.create_index(
+        'ix_audit_log_event_type_correlation_id', 'audit_log', ['event_type', 'correlation_id']
+    )
+
+
+def downgrade() -> None:
+    """Drop event type / correlation id index."""
+    op.drop_index('ix_audit_log_event_type_correlation_id', table_name='audit_log')
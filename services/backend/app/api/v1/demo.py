@@ -20,6 +20,8 @@ from app.models.user import User
 from app.models.prescription import Prescription
 from app.models.dispensing import Dispensing
 from app.models.audit import Audit
+from app.models.did import DID
+from app.models.wallet import Wallet
 from app.db import get_db_session
 
 router = APIRouter(prefix="/admin/demo", tags=["demo"])
@@ -243,6 +245,10 @@ async def reset_demo_data(
         db.query(Dispensing).filter_by(tenant_id=tenant_id).delete()
         db.query(Audit).filter_by(tenant_id=tenant_id).delete()
         db.query(Prescription).filter_by(tenant_id=tenant_id).delete()
+        db.query(DID).filter_by(tenant_id=tenant_id).filter(DID.user_id != current_user.id).delete()
+        db.query(Wallet).filter_by(tenant_id=tenant_id).filter(
+            Wallet.user_id != current_user.id
+        ).delete()
         # Delete all users except the current authenticated user
         db.query(User).filter_by(tenant_id=tenant_id).filter(User.id != current_user.id).delete()
         db.commit()
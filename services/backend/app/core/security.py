@@ -1,9 +1,14 @@
 """Password hashing and verification utilities using bcrypt."""
 
+import os
+
 from passlib.context import CryptContext
 
+# bcrypt cost factor; tests lower it to the library minimum (4) to keep fixtures cheap
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 # Create password context with bcrypt hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 
 def hash_password(password: str) -> str:
@@ -4,7 +4,9 @@ Provides a singleton session factory and context-aware session access.
 Tests can override via pytest fixtures.
 """
 
-from typing import Optional
+from typing import Any, Optional
+
+import orjson
 from sqlalchemy.orm import Session
 
 _test_session: Optional[Session] = None
@@ -37,3 +39,16 @@ def reset_test_session() -> None:
     """Reset test session (for cleanup)."""
     global _test_session
     _test_session = None
+
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson (pass as create_engine(json_serializer=...)).
+
+    OPT_NON_STR_KEYS keeps parity with stdlib json, which coerces int keys to str.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def json_deserializer(value: str) -> Any:
+    """Parse JSON column values with orjson (pass as create_engine(json_deserializer=...))."""
+    return orjson.loads(value)
@@ -5,6 +5,7 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.auth import router as auth_router
 from app.api.v1.prescriptions import router as prescriptions_router
@@ -19,10 +20,17 @@ from app.api.v1.fhir import router as fhir_router
 from app.api.v1.revocation import router as revocation_router
 from app.api.v1.demo import router as demo_router
 
+# Test runs never serve the interactive docs, so skip registering them
+TESTING = os.getenv("TESTING", "false").lower() in ("true", "1", "yes")
+
 app = FastAPI(
     title="Digital Prescription API",
     description="Backend API for digital prescription demo using Self-Sovereign Identity",
     version="0.1.0",
+    openapi_url=None if TESTING else "/openapi.json",
+    docs_url=None if TESTING else "/docs",
+    redoc_url=None if TESTING else "/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware
@@ -1,6 +1,6 @@
 """Audit model for immutable compliance logging."""
 
-from sqlalchemy import Column, Integer, String, DateTime, JSON, event
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, event
 from datetime import datetime
 
 from app.models.base import Base, TenantMixin
@@ -8,6 +8,11 @@ from app.models.base import Base, TenantMixin
 
 class Audit(TenantMixin, Base):
     __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_actor_id_timestamp", "actor_id", "timestamp"),
+        Index("ix_audit_log_event_type_correlation_id", "event_type", "correlation_id"),
+        Index("ix_audit_log_event_type_timestamp", "event_type", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
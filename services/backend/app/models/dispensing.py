@@ -1,6 +1,6 @@
 """Dispensing model for tracking pharmacy dispensing events."""
 
-from sqlalchemy import Column, Integer, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, DateTime, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -9,6 +9,10 @@ from app.models.base import Base, TenantMixin
 
 class Dispensing(TenantMixin, Base):
     __tablename__ = "dispensings"
+    __table_args__ = (
+        Index("ix_dispensings_prescription_id_pharmacist_id", "prescription_id", "pharmacist_id"),
+        Index("ix_dispensings_pharmacist_id_date_dispensed", "pharmacist_id", "date_dispensed"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
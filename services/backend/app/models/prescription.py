@@ -1,6 +1,6 @@
 """Prescription model with FHIR R4 fields."""
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -9,6 +9,19 @@ from app.models.base import Base, TenantMixin
 
 class Prescription(TenantMixin, Base):
     __tablename__ = "prescriptions"
+    __table_args__ = (
+        Index("ix_prescriptions_patient_id_doctor_id", "patient_id", "doctor_id"),
+        Index("ix_prescriptions_doctor_id_date_issued", "doctor_id", "date_issued"),
+        Index("ix_prescriptions_patient_id_date_issued", "patient_id", "date_issued"),
+        # Bulk-revocation selector: patient, then status, then issue date; covering on PostgreSQL
+        Index(
+            "ix_prescriptions_patient_id_status_date_issued",
+            "patient_id",
+            "status",
+            "date_issued",
+            postgresql_include=["id", "medication_name"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
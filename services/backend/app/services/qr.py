@@ -13,7 +13,30 @@ from qrcode.constants import ERROR_CORRECT_H
 from app.services.vc import VCService
 
 
-QR_SIZE_THRESHOLD = 2953
+# Byte-mode capacity of a version-40 symbol at ERROR_CORRECT_H; larger payloads
+# cannot be encoded at that level and must use the URL fallback.
+QR_SIZE_THRESHOLD = 1273
+
+
+def _encode_qr_png(data: str) -> str:
+    # Deliberately not memoized: the payload and the PNG carry prescription data (PHI)
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=ERROR_CORRECT_H,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color="black", back_color="white")
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    buffer.seek(0)
+
+    qr_base64 = base64.b64encode(buffer.read()).decode("utf-8")
+    return qr_base64
 
 
 class QRService:
@@ -22,23 +45,7 @@ class QRService:
         self.tenant_id = tenant_id
 
     def generate_qr(self, data: str) -> str:
-        qr = qrcode.QRCode(
-            version=None,
-            error_correction=ERROR_CORRECT_H,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-
-        img = qr.make_image(fill_color="black", back_color="white")
-
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-
-        qr_base64 = base64.b64encode(buffer.read()).decode("utf-8")
-        return qr_base64
+        return _encode_qr_png(data)
 
     def create_url_fallback(self, credential_id: str, credential: Dict[str, Any]) -> str:
         credential_json = json.dumps(credential, sort_keys=True)
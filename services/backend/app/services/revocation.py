@@ -16,9 +16,40 @@ This is the TDD green phase implementation for TASK-061 tests.
 
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 
+def _parse_range_bound(value):
+    """Coerce a date_range bound (ISO string or datetime) to a naive UTC datetime.
+    
+    date_issued is a naive DateTime holding UTC (default=datetime.utcnow), so
+    aware bounds are converted to UTC and stripped of tzinfo; naive bounds
+    are taken as already in that convention. Comparing against a typed value
+    keeps the predicate a plain range on date_issued, where a raw ISO string
+    would be compared as text on SQLite ('T' vs ' ' separator) and misplace
+    same-day bounds.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _filter_date_issued(query, date_range: dict):
+    """Restrict a Prescription query to a date_range filter ({"start", "end"}, both optional)."""
+    from app.models.prescription import Prescription
+    
+    if "start" in date_range:
+        start = _parse_range_bound(date_range["start"])
+        query = query.filter(Prescription.date_issued >= start)
+    if "end" in date_range:
+        end = _parse_range_bound(date_range["end"])
+        query = query.filter(Prescription.date_issued <= end)
+    return query
+
+
 class RevocationService:
     """Service for managing prescription revocations.
     
@@ -424,8 +455,8 @@ class RevocationService:
         session = self.db or get_db_session()
         
         try:
-            # Build query from filter criteria
-            query = session.query(Prescription)
+            # Build query from filter criteria (ids only; it is also the UPDATE's selector)
+            query = session.query(Prescription.id)
             
             if "patient_id" in filter_criteria:
                 query = query.filter(Prescription.patient_id == filter_criteria["patient_id"])
@@ -440,19 +471,30 @@ class RevocationService:
                 query = query.filter(Prescription.medication_name.ilike(f"%{filter_criteria['medication_name']}%"))
             
             if "date_range" in filter_criteria:
-                date_range = filter_criteria["date_range"]
-                if "start" in date_range:
-                    query = query.filter(Prescription.date_issued >= date_range["start"])
-                if "end" in date_range:
-                    query = query.filter(Prescription.date_issued <= date_range["end"])
+                query = _filter_date_issued(query, filter_criteria["date_range"])
             
-            # Limit to max 100
-            prescriptions = query.limit(101).all()
+            # Limit to max 100: fetch at most 101 so an overflow can be detected
+            targets = query.limit(101)
+            if preview_only:
+                prescription_ids = [rx_id for (rx_id,) in targets.all()]
+            else:
+                # Select and revoke in one UPDATE ... WHERE id IN (<targets>) RETURNING id,
+                # inside a SAVEPOINT so an overflow undoes only this statement
+                savepoint = session.begin_nested()
+                prescription_ids = list(session.scalars(
+                    update(Prescription)
+                    .where(Prescription.id.in_(targets.statement))
+                    .values(status="REVOKED")
+                    .returning(Prescription.id)
+                ))
+                if len(prescription_ids) > 100:
+                    savepoint.rollback()
+                else:
+                    savepoint.commit()
             
-            if len(prescriptions) > 100:
+            if len(prescription_ids) > 100:
                 raise ValueError("Bulk revocation limited to 100 prescriptions maximum")
             
-            prescription_ids = [rx.id for rx in prescriptions]
             bulk_operation_id = str(uuid.uuid4())
             now_sast = datetime.now(self.SAST)
             
@@ -468,7 +510,7 @@ class RevocationService:
                     details={
                         "reason": reason,
                         "filter_criteria": filter_criteria,
-                        "affected_count": len(prescriptions),
+                        "affected_count": len(prescription_ids),
                         "prescription_ids": prescription_ids
                     },
                     correlation_id=bulk_operation_id,
@@ -480,16 +522,13 @@ class RevocationService:
                 return {
                     "bulk_operation_id": bulk_operation_id,
                     "preview": True,
-                    "affected_count": len(prescriptions),
+                    "affected_count": len(prescription_ids),
                     "prescription_ids": prescription_ids,
                     "timestamp": now_sast.isoformat()
                 }
             
-            # Execute bulk revocation
-            revoked_count = 0
-            for rx in prescriptions:
-                rx.status = "REVOKED"
-                revoked_count += 1
+            # Prescriptions were already revoked by the UPDATE above
+            revoked_count = len(prescription_ids)
             
             # Create audit log for bulk operation
             audit = Audit(
@@ -520,7 +559,8 @@ class RevocationService:
             }
             
         except ValueError:
-            session.rollback()
+            # Validation or overflow: nothing of ours is left to undo, and
+            # rolling back the session would discard the caller's pending work
             raise
         except Exception as e:
             session.rollback()
@@ -579,13 +619,18 @@ class RevocationService:
             details = bulk_audit.details or {}
             prescription_ids = details.get("prescription_ids", [])
             
-            # Restore prescriptions to ACTIVE status
+            # Restore still-revoked prescriptions to ACTIVE in a single UPDATE
             restored_count = 0
-            for rx_id in prescription_ids:
-                rx = session.query(Prescription).filter_by(id=rx_id).first()
-                if rx and rx.status == "REVOKED":
-                    rx.status = "ACTIVE"
-                    restored_count += 1
+            if prescription_ids:
+                result = session.execute(
+                    update(Prescription)
+                    .where(
+                        Prescription.id.in_(prescription_ids),
+                        Prescription.status == "REVOKED",
+                    )
+                    .values(status="ACTIVE")
+                )
+                restored_count = result.rowcount
             
             # Create rollback audit entry
             rollback_audit = Audit(
@@ -884,30 +929,28 @@ class RevocationService:
                 Audit.event_type == "revocation_scheduled"
             ).all()
             
+            # Schedules already cancelled or executed, fetched in one query
+            # instead of two lookups per schedule
+            schedule_ids = [audit.correlation_id for audit in scheduled_audits]
+            closed_ids = set()
+            if schedule_ids:
+                closed_ids = {
+                    correlation_id
+                    for (correlation_id,) in session.query(Audit.correlation_id).filter(
+                        Audit.event_type.in_(["revocation_schedule_cancelled", "revocation_executed"]),
+                        Audit.correlation_id.in_(schedule_ids)
+                    )
+                }
+            
             processed = 0
             revoked = 0
             failed = 0
             
             for audit in scheduled_audits:
                 details = audit.details or {}
-                schedule_id = audit.correlation_id
-                
-                # Check if already cancelled
-                cancel_audit = session.query(Audit).filter(
-                    Audit.correlation_id == schedule_id,
-                    Audit.event_type == "revocation_schedule_cancelled"
-                ).first()
-                
-                if cancel_audit:
-                    continue
-                
-                # Check if already executed
-                exec_audit = session.query(Audit).filter(
-                    Audit.correlation_id == schedule_id,
-                    Audit.event_type == "revocation_executed"
-                ).first()
                 
-                if exec_audit:
+                # Skip if already cancelled or executed
+                if audit.correlation_id in closed_ids:
                     continue
                 
                 # Check if due
@@ -1244,11 +1287,7 @@ class RevocationService:
                 query = query.filter(Prescription.medication_name.ilike(f"%{filter_criteria['medication_name']}%"))
             
             if "date_range" in filter_criteria:
-                date_range = filter_criteria["date_range"]
-                if "start" in date_range:
-                    query = query.filter(Prescription.date_issued >= date_range["start"])
-                if "end" in date_range:
-                    query = query.filter(Prescription.date_issued <= date_range["end"])
+                query = _filter_date_issued(query, filter_criteria["date_range"])
             
             prescriptions = query.limit(101).all()
             
@@ -1,13 +1,30 @@
 """Pytest fixtures for database and application testing."""
 
+import os
+
+# Must be set before any app module is imported:
+# - minimum bcrypt cost for test users (app.core.security)
+# - no OpenAPI/docs routes on the app (app.main)
+# - keep the app's own engine in memory too, so a request that bypasses the
+#   get_db override never reaches Postgres or a file on disk (app.dependencies.auth)
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+os.environ.setdefault("TESTING", "1")
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 import asyncio
+import functools
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 
 from app.core.security import hash_password
+from app.core import auth as core_auth
 from app.core.auth import create_access_token, create_refresh_token
+from app.db import json_serializer, json_deserializer
+from app.models.prescription import Prescription
 
 
 @pytest.fixture(scope="session")
@@ -18,48 +35,93 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _memoized_qr_encoding():
+    """Cache QR PNG encoding for the test session only.
+
+    Mask selection and the PNG write dominate QR cost, and the tests encode the
+    same few payloads over and over. Production encodes every time so that no
+    prescription data is kept in memory.
+    """
+    from app.services import qr as qr_module
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            qr_module, "_encode_qr_png", functools.lru_cache(maxsize=None)(qr_module._encode_qr_png)
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
 def test_db_url():
     """Use in-memory SQLite for fast tests."""
-    return "sqlite:///:memory:"
+    return "sqlite+pysqlite:///:memory:"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_engine(test_db_url):
-    """Create SQLAlchemy engine for tests with in-memory SQLite."""
+    """Create SQLAlchemy engine for tests with in-memory SQLite.
+
+    Built once per session. The schema and default tenant are created up front
+    and every test runs inside a transaction that is rolled back afterwards.
+    """
     engine = create_engine(
         test_db_url,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
-    return engine
+
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, _connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_connection.isolation_level = None
+        # SQLite ignores FOREIGN KEY clauses unless asked per connection
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+        # Throwaway database: skip durability work on every commit
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+        dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+        dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Import here to avoid circular imports with models
+    from app.models.base import Base
+    from app.models.tenant import Tenant
+
+    Base.metadata.create_all(bind=engine)
+
+    # Create default tenant for multi-tenancy support
+    with Session(bind=engine) as session:
+        session.add(Tenant(id="default", name="Default Tenant", is_active=True))
+        session.commit()
+
+    yield engine
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
 
 
 @pytest.fixture
-def test_session(test_engine) -> Session:
+def test_session(request, test_engine) -> Session:
     """Create a new database session for a test.
 
-    Creates all tables before test, drops all after.
+    The session is bound to a connection holding an outer transaction; the
+    test's own commit() calls only release SAVEPOINTs, and the outer
+    transaction is rolled back on teardown so nothing leaks between tests.
+    Modules marked ``module_seeded_users`` get ``module_test_session`` instead.
     """
-    # Import here to avoid circular imports with models
-    # Will fail until TASK-007 implements the models
-    try:
-        from app.models.base import Base
+    if request.node.get_closest_marker("module_seeded_users"):
+        yield request.getfixturevalue("module_test_session")
+        return
 
-        Base.metadata.create_all(bind=test_engine)
-    except ImportError:
-        # Models don't exist yet - expected in TDD
-        pass
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
-    SessionLocal = sessionmaker(bind=test_engine)
-    session = SessionLocal()
-
-    # Create default tenant for multi-tenancy support
-    from app.models.tenant import Tenant
-    default_tenant = Tenant(id="default", name="Default Tenant", is_active=True)
-    session.add(default_tenant)
-    session.commit()
-    
     # Set test session globally so services can access it
     from app.db import set_test_session, reset_test_session
     set_test_session(session)
@@ -68,54 +130,8 @@ def test_session(test_engine) -> Session:
 
     session.close()
     reset_test_session()
-
-    # Drop all tables after test
-    try:
-        from app.models.base import Base
-
-        Base.metadata.drop_all(bind=test_engine)
-    except ImportError:
-        # Models don't exist yet - expected in TDD
-        pass
-
-
-@pytest.fixture
-def doctor_user_data():
-    """Sample doctor user data for tests."""
-    return {
-        "username": "dr_smith",
-        "email": "smith@hospital.co.za",
-        "password_hash": "hashed_password_123",
-        "role": "doctor",
-        "full_name": "Dr. John Smith",
-        "registration_number": "HPCSA_12345",
-    }
-
-
-@pytest.fixture
-def patient_user_data():
-    """Sample patient user data for tests."""
-    return {
-        "username": "john_doe",
-        "email": "john@example.com",
-        "password_hash": "hashed_password_456",
-        "role": "patient",
-        "full_name": "John Doe",
-        "registration_number": None,
-    }
-
-
-@pytest.fixture
-def pharmacist_user_data():
-    """Sample pharmacist user data for tests."""
-    return {
-        "username": "pharmacy_alice",
-        "email": "alice@pharmacy.co.za",
-        "password_hash": "hashed_password_789",
-        "role": "pharmacist",
-        "full_name": "Alice Pharmacy",
-        "registration_number": "SAPC_67890",
-    }
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -166,61 +182,221 @@ def audit_event_data():
     }
 
 
-@pytest.fixture
-def doctor_user(test_session):
-    """Create a doctor user in the test database."""
-    from app.models.user import User
-    
-    user = User(
-        username="dr_smith",
-        email="smith@hospital.co.za",
-        password_hash=hash_password("password123"),
-        role="doctor",
-        full_name="Dr. John Smith",
-        registration_number="HPCSA_12345",
+# Salted per process rather than per call: every fixture user with the same
+# password shares one real (verifiable) bcrypt hash, computed once.
+_password_hash = functools.lru_cache(maxsize=None)(hash_password)
+
+
+# Column values (plus plaintext password) for the standard fixture users, keyed
+# by the prefix of their fixture name. Both the per-test user fixtures and
+# module_users_db build their rows from here.
+_FIXTURE_USERS = {
+    "doctor": {
+        "username": "dr_smith",
+        "email": "smith@hospital.co.za",
+        "password": "password123",
+        "role": "doctor",
+        "full_name": "Dr. John Smith",
+        "registration_number": "HPCSA_12345",
+    },
+    "patient": {
+        "username": "patient_doe",
+        "email": "patient@example.com",
+        "password": "password456",
+        "role": "patient",
+        "full_name": "John Doe",
+        "registration_number": None,
+    },
+    "pharmacist": {
+        "username": "pharm_jones",
+        "email": "jones@pharmacy.co.za",
+        "password": "password789",
+        "role": "pharmacist",
+        "full_name": "Alice Jones",
+        "registration_number": "SAPC_67890",
+    },
+    "other_patient": {
+        "username": "patient_other",
+        "email": "other@example.com",
+        "password": "password123",
+        "role": "patient",
+        "full_name": "Other Patient",
+        "registration_number": None,
+    },
+}
+
+# Users module_users_db seeds for modules marked module_seeded_users
+_MODULE_SEEDED_USERS = ("doctor", "patient", "pharmacist")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "module_seeded_users: seed doctor/patient/pharmacist once per module "
+        "and run each test in a SAVEPOINT (see module_users_db)",
     )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+
+
+def _new_user(key):
+    from app.models.user import User
+
+    fields = dict(_FIXTURE_USERS[key])
+    return User(password_hash=_password_hash(fields.pop("password")), **fields)
+
+
+def _fixture_user(request, session, key):
+    """Return the ``key`` fixture user in ``session``.
+
+    In a module marked ``module_seeded_users`` the seeded row is loaded by id;
+    otherwise the user is inserted for this test.
+    """
+    if key in _MODULE_SEEDED_USERS and request.node.get_closest_marker("module_seeded_users"):
+        from app.models.user import User
+
+        _, user_ids = request.getfixturevalue("module_users_db")
+        return session.get(User, user_ids[key])
+
+    user = _new_user(key)
+    session.add(user)
+    session.commit()
+    session.refresh(user)
     return user
 
 
 @pytest.fixture
-def patient_user(test_session):
+def doctor_user(request, test_session):
+    """Create a doctor user in the test database."""
+    return _fixture_user(request, test_session, "doctor")
+
+
+@pytest.fixture
+def patient_user(request, test_session):
     """Create a patient user in the test database."""
-    from app.models.user import User
-    
-    user = User(
-        username="patient_doe",
-        email="patient@example.com",
-        password_hash=hash_password("password456"),
-        role="patient",
-        full_name="John Doe",
-        registration_number=None,
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-    return user
+    return _fixture_user(request, test_session, "patient")
 
 
 @pytest.fixture
-def pharmacist_user(test_session):
+def pharmacist_user(request, test_session):
     """Create a pharmacist user in the test database."""
-    from app.models.user import User
-    
-    user = User(
-        username="pharm_jones",
-        email="jones@pharmacy.co.za",
-        password_hash=hash_password("password789"),
-        role="pharmacist",
-        full_name="Alice Jones",
-        registration_number="SAPC_67890",
-    )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
-    return user
+    return _fixture_user(request, test_session, "pharmacist")
+
+
+@pytest.fixture
+def other_patient_user(request, test_session):
+    """Create a second patient who does not own any fixture prescriptions."""
+    return _fixture_user(request, test_session, "other_patient")
+
+
+@pytest.fixture(scope="module")
+def module_users_db(test_engine):
+    """Connection holding a module-long transaction with the three users seeded once.
+
+    For modules whose tests never modify the users. Opt in with
+    ``pytestmark = pytest.mark.module_seeded_users``: ``test_session`` then
+    becomes ``module_test_session`` and the user fixtures load these rows by
+    id, so the users are inserted once per module instead of once per test.
+    The whole transaction is rolled back when the module finishes.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        users = {key: _new_user(key) for key in _MODULE_SEEDED_USERS}
+        session.add_all(users.values())
+        session.commit()
+        user_ids = {key: user.id for key, user in users.items()}
+
+    yield connection, user_ids
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def module_test_session(module_users_db) -> Session:
+    """Per-test session inside a SAVEPOINT on the module_users_db connection."""
+    from app.db import set_test_session, reset_test_session
+
+    connection, _ = module_users_db
+    savepoint = connection.begin_nested()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    set_test_session(session)
+
+    yield session
+
+    session.close()
+    reset_test_session()
+    savepoint.rollback()
+
+
+# Built once and reused by prescription_factory; RETURNING hands back the ORM objects
+_PRESCRIPTION_INSERT = insert(Prescription).returning(Prescription)
+
+# Columns prescription_factory fills in unless prescription_defaults or the call overrides them
+_PRESCRIPTION_FACTORY_DEFAULTS = {
+    "medication_name": "Amoxicillin",
+    "medication_code": "J01CA04",
+    "dosage": "500mg",
+    "quantity": 30,
+    "instructions": "Take one tablet three times daily with food",
+    "is_repeat": True,
+    "repeat_count": 2,
+    "digital_signature": "sig_xyz789",
+    "credential_id": "cred_abc123",
+}
+
+
+@pytest.fixture
+def prescription_defaults():
+    """Module-specific prescription_factory defaults; override in a module to change them.
+
+    Here: issued now, expiring in 30 days.
+    """
+    now = datetime.now(timezone.utc)
+    return {"date_issued": now, "date_expires": now + timedelta(days=30)}
+
+
+@pytest.fixture
+def prescriptions_factory(test_session, doctor_user, patient_user, prescription_defaults):
+    """Return a callable that inserts one Prescription per dict in ``rows``.
+
+    All rows go out in a single executemany INSERT ... RETURNING; each dict
+    overrides the defaults described on prescription_factory.
+    """
+    def _make_many(rows):
+        prescriptions = test_session.scalars(
+            _PRESCRIPTION_INSERT,
+            [
+                {
+                    "patient_id": patient_user.id,
+                    "doctor_id": doctor_user.id,
+                    **_PRESCRIPTION_FACTORY_DEFAULTS,
+                    **prescription_defaults,
+                    **row,
+                }
+                for row in rows
+            ],
+        ).all()
+        # commit, not flush: the services call session.rollback() on a failed
+        # operation, which would discard an uncommitted row mid-test. Committing
+        # only releases a SAVEPOINT and expires the instances, so no refresh() is
+        # needed - attributes reload on first access.
+        test_session.commit()
+        return prescriptions
+
+    return _make_many
+
+
+@pytest.fixture
+def prescription_factory(prescriptions_factory):
+    """Return a callable that inserts a Prescription; keyword arguments override defaults.
+
+    Defaults: signed Amoxicillin 500mg x30 from doctor_user to patient_user with
+    2 repeats, plus whatever ``prescription_defaults`` supplies.
+    """
+    def _make(**overrides):
+        return prescriptions_factory([overrides])[0]
+
+    return _make
 
 
 @pytest.fixture
@@ -240,48 +416,96 @@ def override_get_db(test_session):
     app.dependency_overrides.clear()
 
 
+@functools.lru_cache(maxsize=64)
+def _signed_token(
+    sub: str, username: str, role: str, tenant_id: str, secret: str, refresh: bool
+) -> str:
+    """Sign a token once per distinct claim set for the whole session.
+
+    Users are recreated for every test, but their claims are identical across
+    tests. ``secret`` is part of the key so a rotated SECRET_KEY never serves a
+    stale token. Access tokens get a long expiry so they outlive the run.
+    """
+    claims = {"sub": sub, "username": username, "role": role, "tenant_id": tenant_id}
+    if refresh:
+        return create_refresh_token(claims)
+    return create_access_token(claims, expires_delta=timedelta(hours=12))
+
+
+def _token_for(user, refresh: bool = False) -> str:
+    return _signed_token(
+        str(user.id),
+        user.username,
+        str(user.role),
+        getattr(user, "tenant_id", "default"),
+        core_auth.SECRET_KEY,
+        refresh,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _auth_headers(token):
+    """Read-only bearer auth header, built once per (cached) token.
+
+    No Content-Type: httpx sets it for requests that send a JSON body.
+    """
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
 @pytest.fixture
 def valid_jwt_token(doctor_user):
     """Generate real JWT token for doctor user."""
-    return create_access_token({
-        "sub": str(doctor_user.id),
-        "username": doctor_user.username,
-        "role": str(doctor_user.role),
-        "tenant_id": getattr(doctor_user, "tenant_id", "default"),
-    })
+    return _token_for(doctor_user)
 
 
 @pytest.fixture
 def valid_patient_jwt_token(patient_user):
     """Generate real JWT token for patient user."""
-    return create_access_token({
-        "sub": str(patient_user.id),
-        "username": patient_user.username,
-        "role": str(patient_user.role),
-        "tenant_id": getattr(patient_user, "tenant_id", "default"),
-    })
+    return _token_for(patient_user)
 
 
 @pytest.fixture
 def valid_pharmacist_jwt_token(pharmacist_user):
     """Generate real JWT token for pharmacist user."""
-    return create_access_token({
-        "sub": str(pharmacist_user.id),
-        "username": pharmacist_user.username,
-        "role": str(pharmacist_user.role),
-        "tenant_id": getattr(pharmacist_user, "tenant_id", "default"),
-    })
+    return _token_for(pharmacist_user)
+
+
+@pytest.fixture
+def valid_other_patient_jwt_token(other_patient_user):
+    """Generate real JWT token for other_patient_user."""
+    return _token_for(other_patient_user)
 
 
 @pytest.fixture
 def valid_refresh_token(doctor_user):
     """Generate real refresh token for doctor user."""
-    return create_refresh_token({
-        "sub": str(doctor_user.id),
-        "username": doctor_user.username,
-        "role": str(doctor_user.role),
-        "tenant_id": getattr(doctor_user, "tenant_id", "default"),
-    })
+    return _token_for(doctor_user, refresh=True)
+
+
+# The users are function-scoped (DB isolation), so these fixtures are too; the
+# header mapping itself is built once per token by _auth_headers.
+@pytest.fixture
+def doctor_headers(valid_jwt_token):
+    """Headers with doctor JWT token."""
+    return _auth_headers(valid_jwt_token)
+
+
+@pytest.fixture
+def patient_headers(valid_patient_jwt_token):
+    """Headers with patient JWT token."""
+    return _auth_headers(valid_patient_jwt_token)
+
+
+@pytest.fixture
+def pharmacist_headers(valid_pharmacist_jwt_token):
+    """Headers with pharmacist JWT token."""
+    return _auth_headers(valid_pharmacist_jwt_token)
+
+
+@pytest.fixture
+def other_patient_headers(valid_other_patient_jwt_token):
+    """Headers with JWT token for a patient who does not own the prescriptions."""
+    return _auth_headers(valid_other_patient_jwt_token)
 
 
 @pytest.fixture
@@ -430,24 +654,22 @@ def mock_acapy_signing_service(monkeypatch):
     return MockACAPyService
 
 
-@pytest.fixture
-async def async_client(test_session):
-    """Create async test client for FastAPI app."""
+@pytest.fixture(scope="session")
+async def session_async_client():
+    """httpx.AsyncClient over ASGITransport, built once for the whole session.
+
+    The client holds no per-test state; database access is routed per test by
+    the get_db override installed in ``async_client``.
+    """
     from httpx import AsyncClient, ASGITransport
     from app.main import app
-    from app.dependencies.auth import get_db
-    
-    def override_get_db():
-        try:
-            yield test_session
-        finally:
-            pass
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
+
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
-    
-    app.dependency_overrides.clear()
 
+
+@pytest.fixture
+def async_client(override_get_db, session_async_client):
+    """Async test client for FastAPI app, bound to this test's test_session."""
+    return session_async_client
@@ -9,7 +9,6 @@ Tests cover:
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from datetime import datetime, timedelta
 
 
@@ -19,14 +18,9 @@ from datetime import datetime, timedelta
 
 
 @pytest.fixture
-def test_client(override_get_db, doctor_user, patient_user, pharmacist_user):
-    """Create FastAPI TestClient for making requests.
-
-    Will fail until app has auth routes.
-    """
-    from app.main import app
-
-    return TestClient(app)
+def test_client(async_client, doctor_user, patient_user, pharmacist_user):
+    """In-process httpx.AsyncClient (ASGITransport) with all three users seeded."""
+    return async_client
 
 
 @pytest.fixture
@@ -121,7 +115,7 @@ async def test_login_success(test_client, doctor_auth_payload):
         }
     }
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/login",
         json=doctor_auth_payload,
     )
@@ -154,7 +148,7 @@ async def test_login_invalid_credentials(test_client):
         "detail": "Invalid username or password"
     }
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/login",
         json={
             "username": "nonexistent_user",
@@ -185,7 +179,7 @@ async def test_login_missing_credentials(test_client):
         ]
     }
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/login",
         json={"username": "dr_smith"},  # Missing password
     )
@@ -200,7 +194,7 @@ async def test_login_empty_body(test_client):
 
     EXPECTED FAILURE: Endpoint does not exist yet.
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/login",
         json={},
     )
@@ -227,7 +221,7 @@ async def test_token_refresh_success(test_client, valid_refresh_token):
         "expires_in": 3600
     }
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/refresh",
         json={"refresh_token": valid_refresh_token},
     )
@@ -254,7 +248,7 @@ async def test_token_refresh_invalid_token(test_client, invalid_jwt_token):
         "detail": "Invalid refresh token"
     }
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/refresh",
         json={"refresh_token": invalid_jwt_token},
     )
@@ -279,7 +273,7 @@ async def test_token_validation_endpoint(test_client, valid_jwt_token):
         "expires_in": 3599
     }
     """
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/auth/validate",
         headers={"Authorization": f"Bearer {valid_jwt_token}"},
     )
@@ -307,7 +301,7 @@ async def test_token_validation_invalid(test_client, invalid_jwt_token):
         "detail": "Invalid token"
     }
     """
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/auth/validate",
         headers={"Authorization": f"Bearer {invalid_jwt_token}"},
     )
@@ -334,7 +328,7 @@ async def test_protected_route_with_valid_token(test_client, auth_headers_doctor
     - Extracts user info from token
     - Allows request to proceed
     """
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/prescriptions",
         headers=auth_headers_doctor,
     )
@@ -355,7 +349,7 @@ async def test_protected_route_without_token(test_client):
         "detail": "Not authenticated"
     }
     """
-    response = test_client.get("/api/v1/prescriptions")
+    response = await test_client.get("/api/v1/prescriptions")
 
     # FAILS - 404 because route doesn't exist yet
     # When TASK-010 is complete, should be 401 Unauthorized
@@ -373,7 +367,7 @@ async def test_protected_route_with_invalid_token(test_client, auth_headers_inva
         "detail": "Invalid authentication credentials"
     }
     """
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/prescriptions",
         headers=auth_headers_invalid,
     )
@@ -393,7 +387,7 @@ async def test_protected_route_with_malformed_token(test_client):
     - Authorization header format should be "Bearer <token>"
     - Malformed headers should be rejected
     """
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/prescriptions",
         headers={"Authorization": "InvalidFormatToken"},
     )
@@ -413,7 +407,7 @@ async def test_protected_route_with_bearer_prefix_only(test_client):
     - Should validate Bearer token format
     - Empty token should be rejected
     """
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/prescriptions",
         headers={"Authorization": "Bearer "},
     )
@@ -446,7 +440,7 @@ async def test_doctor_create_prescription(test_client, auth_headers_doctor):
         "date_expires": (datetime.utcnow() + timedelta(days=90)).isoformat(),
     }
 
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/prescriptions",
         json=prescription_data,
         headers=auth_headers_doctor,
@@ -474,7 +468,7 @@ async def test_patient_cannot_create_prescription(test_client, auth_headers_pati
         "date_expires": (datetime.utcnow() + timedelta(days=90)).isoformat(),
     }
 
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/prescriptions",
         json=prescription_data,
         headers=auth_headers_patient,
@@ -507,7 +501,7 @@ async def test_pharmacist_cannot_create_prescription(test_client, valid_jwt_toke
         "date_expires": (datetime.utcnow() + timedelta(days=90)).isoformat(),
     }
 
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/prescriptions",
         json=prescription_data,
         headers=headers,
@@ -533,7 +527,7 @@ async def test_doctor_sign_prescription(test_client, auth_headers_doctor):
         "signature": "digital_signature_here",
     }
 
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/prescriptions/1/sign",
         json=sign_data,
         headers=auth_headers_doctor,
@@ -560,7 +554,7 @@ async def test_pharmacist_view_prescription(test_client, valid_jwt_token):
         "Content-Type": "application/json",
     }
 
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/prescriptions/1",
         headers=headers,
     )
@@ -586,7 +580,7 @@ async def test_pharmacist_verify_prescription(test_client, valid_jwt_token):
         "Content-Type": "application/json",
     }
 
-    response = test_client.get(
+    response = await test_client.get(
         "/api/v1/prescriptions/1/verify",
         headers=headers,
     )
@@ -612,7 +606,7 @@ async def test_logout_success(test_client, auth_headers_doctor):
     - Token is blacklisted/revoked
     - Returns 200 OK
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/logout",
         headers=auth_headers_doctor,
     )
@@ -632,7 +626,7 @@ async def test_logout_without_token(test_client):
     - Should require valid token
     - Returns 401 Unauthorized
     """
-    response = test_client.post("/api/v1/auth/logout")
+    response = await test_client.post("/api/v1/auth/logout")
 
     # FAILS - 404 because endpoint doesn't exist yet
     # When TASK-010 is complete, should be 401 Unauthorized
@@ -651,7 +645,7 @@ async def test_token_after_logout_rejected(test_client, auth_headers_doctor):
     2. GET /api/v1/prescriptions with same token → 401 Unauthorized
     """
     # Step 1: Logout
-    logout_response = test_client.post(
+    logout_response = await test_client.post(
         "/api/v1/auth/logout",
         headers=auth_headers_doctor,
     )
@@ -660,7 +654,7 @@ async def test_token_after_logout_rejected(test_client, auth_headers_doctor):
     # Should be 200 OK when implemented
     if logout_response.status_code == 200:
         # Step 2: Try to use same token
-        prescriptions_response = test_client.get(
+        prescriptions_response = await test_client.get(
             "/api/v1/prescriptions",
             headers=auth_headers_doctor,
         )
@@ -683,7 +677,7 @@ async def test_login_case_insensitive_username(test_client):
     Note: Implementation will decide if usernames are case-sensitive.
     This test documents expected behavior.
     """
-    response = test_client.post(
+    response = await test_client.post(
         "/api/v1/auth/login",
         json={
             "username": "DR_SMITH",  # Uppercase
@@ -710,7 +704,7 @@ async def test_login_rate_limiting(test_client, doctor_auth_payload):
     """
     # Try 5 failed login attempts
     for i in range(5):
-        test_client.post(
+        await test_client.post(
             "/api/v1/auth/login",
             json={
                 "username": doctor_auth_payload["username"],
@@ -719,7 +713,7 @@ async def test_login_rate_limiting(test_client, doctor_auth_payload):
         )
 
     # Final attempt should be rate-limited if implemented
-    final_response = test_client.post(
+    final_response = await test_client.post(
         "/api/v1/auth/login",
         json=doctor_auth_payload,
     )
@@ -741,7 +735,7 @@ async def test_concurrent_login_sessions(test_client, doctor_auth_payload):
     - Logout revokes only specified token
     """
     # First login
-    response1 = test_client.post(
+    response1 = await test_client.post(
         "/api/v1/auth/login",
         json=doctor_auth_payload,
     )
@@ -752,7 +746,7 @@ async def test_concurrent_login_sessions(test_client, doctor_auth_payload):
         token1 = response1.json()["access_token"]
 
         # Second login (same user)
-        response2 = test_client.post(
+        response2 = await test_client.post(
             "/api/v1/auth/login",
             json=doctor_auth_payload,
         )
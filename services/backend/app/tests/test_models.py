@@ -2,6 +2,72 @@
 
 import pytest
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from app.models.user import User
+from app.models.prescription import Prescription
+from app.models.dispensing import Dispensing
+from app.models.audit import Audit
+
+# Core INSERT built once and reused for bulk seeding (bypasses ORM unit of work).
+PRESCRIPTION_INSERT = insert(Prescription)
+
+# Computed once per module; tests only need a stable reference point.
+NOW = datetime.now()
+EXPIRES_90D = NOW + timedelta(days=90)
+
+# Read-only user kwargs shared by every test; use dict(DATA, key=...) to vary one.
+DOCTOR_USER_DATA = MappingProxyType(
+    {
+        "username": "dr_smith",
+        "email": "smith@hospital.co.za",
+        "password_hash": "hashed_password_123",
+        "role": "doctor",
+        "full_name": "Dr. John Smith",
+        "registration_number": "HPCSA_12345",
+    }
+)
+
+PATIENT_USER_DATA = MappingProxyType(
+    {
+        "username": "john_doe",
+        "email": "john@example.com",
+        "password_hash": "hashed_password_456",
+        "role": "patient",
+        "full_name": "John Doe",
+        "registration_number": None,
+    }
+)
+
+PHARMACIST_USER_DATA = MappingProxyType(
+    {
+        "username": "pharmacy_alice",
+        "email": "alice@pharmacy.co.za",
+        "password_hash": "hashed_password_789",
+        "role": "pharmacist",
+        "full_name": "Alice Pharmacy",
+        "registration_number": "SAPC_67890",
+    }
+)
+
+# Every optional Prescription column populated, so one row exercises them all.
+PRESCRIPTION_FIELDS = MappingProxyType(
+    {
+        "medication_name": "Amoxicillin",
+        "medication_code": "J01CA04",
+        "dosage": "500mg",
+        "quantity": 21,
+        "instructions": "Take one tablet three times daily",
+        "date_issued": NOW,
+        "date_expires": EXPIRES_90D,
+        "digital_signature": "sig_xyz789_digital_signature_value",
+        "is_repeat": True,
+        "repeat_count": 3,
+        "credential_id": "cred_abc123def456",
+    }
+)
 
 
 class TestUserModel:
@@ -9,8 +75,6 @@ class TestUserModel:
 
     async def test_user_create(self, test_session):
         """Create a user with required fields."""
-        from app.models.user import User
-
         user = User(
             username="dr_smith",
             email="smith@hospital.co.za",
@@ -28,8 +92,6 @@ class TestUserModel:
 
     async def test_user_role_validation(self, test_session):
         """Validate role must be one of: doctor, patient, pharmacist."""
-        from app.models.user import User
-
         valid_roles = ["doctor", "patient", "pharmacist"]
 
         for role in valid_roles:
@@ -47,9 +109,6 @@ class TestUserModel:
 
     async def test_user_invalid_role(self, test_session):
         """Reject invalid role values."""
-        from app.models.user import User
-        from sqlalchemy.exc import IntegrityError
-
         user = User(
             username="invalid_user",
             email="invalid@example.com",
@@ -63,9 +122,6 @@ class TestUserModel:
 
     async def test_user_unique_email(self, test_session):
         """Email must be unique across users."""
-        from app.models.user import User
-        from sqlalchemy.exc import IntegrityError
-
         user1 = User(
             username="user1",
             email="duplicate@example.com",
@@ -88,8 +144,6 @@ class TestUserModel:
 
     async def test_user_did_field(self, test_session):
         """User can have a DID (Decentralized Identifier)."""
-        from app.models.user import User
-
         user = User(
             username="did_user",
             email="did@example.com",
@@ -104,40 +158,35 @@ class TestUserModel:
         retrieved = test_session.query(User).filter_by(username="did_user").first()
         assert retrieved.did == "did:cheqd:testnet:abc123def456"
 
-    async def test_user_has_many_prescriptions(
-        self, test_session, doctor_user_data, patient_user_data
-    ):
+    async def test_user_has_many_prescriptions(self, test_session):
         """Doctor user has many prescriptions as issuer."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
 
         test_session.add_all([doctor, patient])
         test_session.flush()
 
-        # Create prescriptions for this doctor
-        for i in range(3):
-            prescription = Prescription(
-                patient_id=patient.id,
-                doctor_id=doctor.id,
-                medication_name=f"Med{i}",
-                dosage="500mg",
-                quantity=10,
-                instructions="Take daily",
-            )
-            test_session.add(prescription)
-
+        # Create prescriptions for this doctor in one executemany batch
+        test_session.execute(
+            PRESCRIPTION_INSERT,
+            [
+                {
+                    "patient_id": patient.id,
+                    "doctor_id": doctor.id,
+                    "medication_name": f"Med{i}",
+                    "dosage": "500mg",
+                    "quantity": 10,
+                    "instructions": "Take daily",
+                }
+                for i in range(3)
+            ],
+        )
         test_session.commit()
 
         assert len(doctor.prescriptions) == 3
 
     async def test_user_password_hash_required(self, test_session):
         """Password hash must be provided for all users."""
-        from app.models.user import User
-        from sqlalchemy.exc import IntegrityError
-
         user = User(
             username="no_password",
             email="nopass@example.com",
@@ -152,13 +201,13 @@ class TestUserModel:
 class TestPrescriptionModel:
     """Tests for Prescription model - FHIR fields, relationships, timestamps."""
 
-    async def test_prescription_create(self, test_session, doctor_user_data, patient_user_data):
-        """Create a prescription with FHIR-inspired fields."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
+    async def test_prescription_fields(self, test_session):
+        """Prescription persists FHIR fields, signature, expiry, repeats and credential ID.
 
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
+        One fully-populated row covers every field instead of one insert per field.
+        """
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
 
         test_session.add_all([doctor, patient])
         test_session.flush()
@@ -166,70 +215,23 @@ class TestPrescriptionModel:
         prescription = Prescription(
             patient_id=patient.id,
             doctor_id=doctor.id,
-            medication_name="Amoxicillin",
-            medication_code="J01CA04",
-            dosage="500mg",
-            quantity=21,
-            instructions="Take one tablet three times daily",
-            date_issued=datetime.now(),
-            date_expires=datetime.now() + timedelta(days=90),
+            **PRESCRIPTION_FIELDS,
         )
 
         test_session.add(prescription)
         test_session.commit()
 
         assert prescription.id is not None
-        assert prescription.medication_name == "Amoxicillin"
-        assert prescription.medication_code == "J01CA04"
-
-    async def test_prescription_fhir_fields(
-        self, test_session, doctor_user_data, patient_user_data
-    ):
-        """Prescription must include all FHIR-inspired fields."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-
-        test_session.add_all([doctor, patient])
-        test_session.flush()
-
-        fhir_fields = {
-            "medication_name": "Amoxicillin",
-            "medication_code": "J01CA04",
-            "dosage": "500mg",
-            "quantity": 21,
-            "instructions": "Take one tablet three times daily",
-            "date_issued": datetime.now(),
-            "date_expires": datetime.now() + timedelta(days=90),
-        }
-
-        prescription = Prescription(
-            patient_id=patient.id,
-            doctor_id=doctor.id,
-            is_repeat=False,
-            repeat_count=0,
-            **fhir_fields,
-        )
-
-        test_session.add(prescription)
-        test_session.commit()
 
         retrieved = test_session.query(Prescription).first()
+        for field, expected in PRESCRIPTION_FIELDS.items():
+            assert getattr(retrieved, field) == expected, field
+        assert retrieved.date_expires > NOW
 
-        for field, value in fhir_fields.items():
-            assert getattr(retrieved, field) is not None
-
-    async def test_prescription_relationships(
-        self, test_session, doctor_user_data, patient_user_data
-    ):
+    async def test_prescription_relationships(self, test_session):
         """Prescription has relationships to doctor and patient."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
 
         test_session.add_all([doctor, patient])
         test_session.flush()
@@ -250,143 +252,15 @@ class TestPrescriptionModel:
         assert retrieved.patient.username == patient.username
         assert retrieved.doctor.username == doctor.username
 
-    async def test_prescription_digital_signature(
-        self, test_session, doctor_user_data, patient_user_data
-    ):
-        """Prescription can be signed with digital signature."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-
-        test_session.add_all([doctor, patient])
-        test_session.flush()
-
-        signature = "sig_xyz789_digital_signature_value"
-
-        prescription = Prescription(
-            patient_id=patient.id,
-            doctor_id=doctor.id,
-            medication_name="Lisinopril",
-            dosage="10mg",
-            quantity=30,
-            instructions="Take once daily",
-            digital_signature=signature,
-        )
-
-        test_session.add(prescription)
-        test_session.commit()
-
-        retrieved = test_session.query(Prescription).first()
-        assert retrieved.digital_signature == signature
-
-    async def test_prescription_expiration(self, test_session, doctor_user_data, patient_user_data):
-        """Prescription can expire based on date_expires."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-
-        test_session.add_all([doctor, patient])
-        test_session.flush()
-
-        expires_in_future = datetime.now() + timedelta(days=90)
-
-        prescription = Prescription(
-            patient_id=patient.id,
-            doctor_id=doctor.id,
-            medication_name="Medication",
-            dosage="100mg",
-            quantity=30,
-            instructions="Take daily",
-            date_expires=expires_in_future,
-        )
-
-        test_session.add(prescription)
-        test_session.commit()
-
-        retrieved = test_session.query(Prescription).first()
-        assert retrieved.date_expires > datetime.now()
-
-    async def test_prescription_repeat_tracking(
-        self, test_session, doctor_user_data, patient_user_data
-    ):
-        """Prescription tracks repeat/refill information."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-
-        test_session.add_all([doctor, patient])
-        test_session.flush()
-
-        prescription = Prescription(
-            patient_id=patient.id,
-            doctor_id=doctor.id,
-            medication_name="Chronic Medication",
-            dosage="500mg",
-            quantity=30,
-            instructions="Take daily",
-            is_repeat=True,
-            repeat_count=3,
-        )
-
-        test_session.add(prescription)
-        test_session.commit()
-
-        retrieved = test_session.query(Prescription).first()
-        assert retrieved.is_repeat is True
-        assert retrieved.repeat_count == 3
-
-    async def test_prescription_credential_storage(
-        self, test_session, doctor_user_data, patient_user_data
-    ):
-        """Prescription can store verifiable credential ID."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-
-        test_session.add_all([doctor, patient])
-        test_session.flush()
-
-        credential_id = "cred_abc123def456"
-
-        prescription = Prescription(
-            patient_id=patient.id,
-            doctor_id=doctor.id,
-            medication_name="Medicine",
-            dosage="50mg",
-            quantity=20,
-            instructions="Take as needed",
-            credential_id=credential_id,
-        )
-
-        test_session.add(prescription)
-        test_session.commit()
-
-        retrieved = test_session.query(Prescription).first()
-        assert retrieved.credential_id == credential_id
-
 
 class TestDispensingModel:
     """Tests for Dispensing model - tracking, timestamps, pharmacist verification."""
 
-    async def test_dispensing_create(
-        self, test_session, doctor_user_data, patient_user_data, pharmacist_user_data
-    ):
+    async def test_dispensing_create(self, test_session):
         """Create dispensing record for a prescription."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-        from app.models.dispensing import Dispensing
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-        pharmacist = User(**pharmacist_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
+        pharmacist = User(**PHARMACIST_USER_DATA)
 
         test_session.add_all([doctor, patient, pharmacist])
         test_session.flush()
@@ -407,7 +281,7 @@ class TestDispensingModel:
             prescription_id=prescription.id,
             pharmacist_id=pharmacist.id,
             quantity_dispensed=21,
-            date_dispensed=datetime.now(),
+            date_dispensed=NOW,
             verified=True,
         )
 
@@ -417,17 +291,11 @@ class TestDispensingModel:
         assert dispensing.id is not None
         assert dispensing.quantity_dispensed == 21
 
-    async def test_dispensing_relationships(
-        self, test_session, doctor_user_data, patient_user_data, pharmacist_user_data
-    ):
+    async def test_dispensing_relationships(self, test_session):
         """Dispensing has relationships to prescription and pharmacist."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-        from app.models.dispensing import Dispensing
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-        pharmacist = User(**pharmacist_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
+        pharmacist = User(**PHARMACIST_USER_DATA)
 
         test_session.add_all([doctor, patient, pharmacist])
         test_session.flush()
@@ -448,7 +316,7 @@ class TestDispensingModel:
             prescription_id=prescription.id,
             pharmacist_id=pharmacist.id,
             quantity_dispensed=30,
-            date_dispensed=datetime.now(),
+            date_dispensed=NOW,
             verified=True,
         )
 
@@ -459,17 +327,11 @@ class TestDispensingModel:
         assert retrieved.prescription.medication_name == "Medicine"
         assert retrieved.pharmacist.username == pharmacist.username
 
-    async def test_dispensing_timestamp(
-        self, test_session, doctor_user_data, patient_user_data, pharmacist_user_data
-    ):
+    async def test_dispensing_timestamp(self, test_session):
         """Dispensing records when medication was dispensed."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-        from app.models.dispensing import Dispensing
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-        pharmacist = User(**pharmacist_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
+        pharmacist = User(**PHARMACIST_USER_DATA)
 
         test_session.add_all([doctor, patient, pharmacist])
         test_session.flush()
@@ -486,13 +348,11 @@ class TestDispensingModel:
         test_session.add(prescription)
         test_session.flush()
 
-        now = datetime.now()
-
         dispensing = Dispensing(
             prescription_id=prescription.id,
             pharmacist_id=pharmacist.id,
             quantity_dispensed=20,
-            date_dispensed=now,
+            date_dispensed=NOW,
             verified=True,
         )
 
@@ -501,19 +361,13 @@ class TestDispensingModel:
 
         retrieved = test_session.query(Dispensing).first()
         assert retrieved.date_dispensed is not None
-        assert abs((retrieved.date_dispensed - now).total_seconds()) < 1
+        assert retrieved.date_dispensed == NOW
 
-    async def test_dispensing_verification(
-        self, test_session, doctor_user_data, patient_user_data, pharmacist_user_data
-    ):
+    async def test_dispensing_verification(self, test_session):
         """Dispensing can be verified by pharmacist."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-        from app.models.dispensing import Dispensing
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-        pharmacist = User(**pharmacist_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
+        pharmacist = User(**PHARMACIST_USER_DATA)
 
         test_session.add_all([doctor, patient, pharmacist])
         test_session.flush()
@@ -534,7 +388,7 @@ class TestDispensingModel:
             prescription_id=prescription.id,
             pharmacist_id=pharmacist.id,
             quantity_dispensed=30,
-            date_dispensed=datetime.now(),
+            date_dispensed=NOW,
             verified=True,
         )
 
@@ -544,17 +398,11 @@ class TestDispensingModel:
         retrieved = test_session.query(Dispensing).first()
         assert retrieved.verified is True
 
-    async def test_dispensing_notes(
-        self, test_session, doctor_user_data, patient_user_data, pharmacist_user_data
-    ):
+    async def test_dispensing_notes(self, test_session):
         """Dispensing can include pharmacist notes."""
-        from app.models.user import User
-        from app.models.prescription import Prescription
-        from app.models.dispensing import Dispensing
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
-        pharmacist = User(**pharmacist_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
+        pharmacist = User(**PHARMACIST_USER_DATA)
 
         test_session.add_all([doctor, patient, pharmacist])
         test_session.flush()
@@ -577,7 +425,7 @@ class TestDispensingModel:
             prescription_id=prescription.id,
             pharmacist_id=pharmacist.id,
             quantity_dispensed=30,
-            date_dispensed=datetime.now(),
+            date_dispensed=NOW,
             verified=True,
             notes=notes,
         )
@@ -592,12 +440,9 @@ class TestDispensingModel:
 class TestAuditModel:
     """Tests for Audit model - immutable event logging, hash chain."""
 
-    async def test_audit_create(self, test_session, doctor_user_data):
+    async def test_audit_create(self, test_session):
         """Create audit event for system action."""
-        from app.models.user import User
-        from app.models.audit import Audit
-
-        doctor = User(**doctor_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
         test_session.add(doctor)
         test_session.flush()
 
@@ -617,12 +462,9 @@ class TestAuditModel:
         assert audit.id is not None
         assert audit.event_type == "prescription_created"
 
-    async def test_audit_immutable(self, test_session, doctor_user_data):
+    async def test_audit_immutable(self, test_session):
         """Audit records should be immutable (no updates)."""
-        from app.models.user import User
-        from app.models.audit import Audit
-
-        doctor = User(**doctor_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
         test_session.add(doctor)
         test_session.flush()
 
@@ -648,17 +490,12 @@ class TestAuditModel:
         # Verify immutability via versioning or constraint
         assert retrieved.event_type == "user_login"
 
-    async def test_audit_timestamp(self, test_session, doctor_user_data):
+    async def test_audit_timestamp(self, test_session):
         """Audit event includes timestamp."""
-        from app.models.user import User
-        from app.models.audit import Audit
-
-        doctor = User(**doctor_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
         test_session.add(doctor)
         test_session.flush()
 
-        before = datetime.now()
-
         audit = Audit(
             event_type="prescription_signed",
             actor_id=doctor.id,
@@ -671,54 +508,49 @@ class TestAuditModel:
         test_session.add(audit)
         test_session.commit()
 
-        after = datetime.now()
-
         retrieved = test_session.query(Audit).first()
         assert hasattr(retrieved, "timestamp")
         assert retrieved.timestamp is not None
-        assert before <= retrieved.timestamp <= after
+        # Column default is bound to datetime.now at import, so it cannot be frozen.
+        assert NOW <= retrieved.timestamp <= datetime.now()
 
-    async def test_audit_actor_tracking(self, test_session, doctor_user_data, patient_user_data):
+    async def test_audit_actor_tracking(self, test_session):
         """Audit tracks who performed action and their role."""
-        from app.models.user import User
-        from app.models.audit import Audit
-
-        doctor = User(**doctor_user_data)
-        patient = User(**patient_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
+        patient = User(**PATIENT_USER_DATA)
 
         test_session.add_all([doctor, patient])
         test_session.flush()
 
-        audit_doctor = Audit(
-            event_type="prescription_created",
-            actor_id=doctor.id,
-            actor_role="doctor",
-            resource_type="prescription",
-            resource_id=1,
-            action="create",
-        )
-
-        audit_patient = Audit(
-            event_type="prescription_viewed",
-            actor_id=patient.id,
-            actor_role="patient",
-            resource_type="prescription",
-            resource_id=1,
-            action="view",
+        test_session.execute(
+            insert(Audit),
+            [
+                {
+                    "event_type": "prescription_created",
+                    "actor_id": doctor.id,
+                    "actor_role": "doctor",
+                    "resource_type": "prescription",
+                    "resource_id": 1,
+                    "action": "create",
+                },
+                {
+                    "event_type": "prescription_viewed",
+                    "actor_id": patient.id,
+                    "actor_role": "patient",
+                    "resource_type": "prescription",
+                    "resource_id": 1,
+                    "action": "view",
+                },
+            ],
         )
-
-        test_session.add_all([audit_doctor, audit_patient])
         test_session.commit()
 
         assert test_session.query(Audit).filter_by(actor_role="doctor").count() == 1
         assert test_session.query(Audit).filter_by(actor_role="patient").count() == 1
 
-    async def test_audit_resource_tracking(self, test_session, doctor_user_data):
+    async def test_audit_resource_tracking(self, test_session):
         """Audit tracks resource type and ID."""
-        from app.models.user import User
-        from app.models.audit import Audit
-
-        doctor = User(**doctor_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
         test_session.add(doctor)
         test_session.flush()
 
@@ -738,12 +570,9 @@ class TestAuditModel:
         assert retrieved.resource_type == "prescription"
         assert retrieved.resource_id == 42
 
-    async def test_audit_event_details(self, test_session, doctor_user_data):
+    async def test_audit_event_details(self, test_session):
         """Audit can store event details as JSON."""
-        from app.models.user import User
-        from app.models.audit import Audit
-
-        doctor = User(**doctor_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
         test_session.add(doctor)
         test_session.flush()
 
@@ -771,12 +600,9 @@ class TestAuditModel:
         assert retrieved.details == details
         assert retrieved.details["medication"] == "Aspirin"
 
-    async def test_audit_ip_address_logging(self, test_session, doctor_user_data):
+    async def test_audit_ip_address_logging(self, test_session):
         """Audit can log IP address for security."""
-        from app.models.user import User
-        from app.models.audit import Audit
-
-        doctor = User(**doctor_user_data)
+        doctor = User(**DOCTOR_USER_DATA)
         test_session.add(doctor)
         test_session.flush()
 
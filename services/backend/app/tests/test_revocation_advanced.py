@@ -16,35 +16,49 @@ import pytest
 import uuid
 from datetime import datetime, timedelta, timezone
 from freezegun import freeze_time
+from sqlalchemy import select
 
 from app.services.revocation import RevocationService
 from app.models.prescription import Prescription
 from app.models.user import User
 from app.models.audit import Audit
 
-
 SAST = timezone(timedelta(hours=2))
 
 
-def _create_test_prescription(session, doctor_id, patient_id, status="ACTIVE", medication_name="Amoxicillin", **kwargs):
-    """Helper to create test prescriptions."""
-    rx = Prescription(
-        doctor_id=doctor_id,
-        patient_id=patient_id,
-        medication_name=medication_name,
-        medication_code="J01CA04",
-        dosage="500mg",
-        quantity=21,
-        instructions="Take three times daily",
-        date_issued=datetime.now(SAST),
-        date_expires=datetime.now(SAST) + timedelta(days=90),
-        status=status,
-        **kwargs
-    )
-    session.add(rx)
-    session.commit()
-    session.refresh(rx)
-    return rx
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def prescription_defaults():
+    """prescription_factory defaults for this module.
+
+    Unsigned Amoxicillin 500mg x21 without repeats, issued now and expiring in
+    90 days. The clock is read once per test, so rows a test creates share
+    one issue date.
+    """
+    now = datetime.now(SAST)
+    return {
+        "quantity": 21,
+        "instructions": "Take three times daily",
+        "is_repeat": False,
+        "repeat_count": 0,
+        "digital_signature": None,
+        "credential_id": None,
+        "date_issued": now,
+        "date_expires": now + timedelta(days=90),
+    }
+
+
+def _refresh_many(session, *prescriptions):
+    """Reload several prescriptions from the database in one SELECT ... WHERE id IN."""
+    session.scalars(
+        select(Prescription)
+        .where(Prescription.id.in_([rx.id for rx in prescriptions]))
+        .execution_options(populate_existing=True)
+    ).all()
 
 
 # ============================================================================
@@ -55,10 +69,10 @@ def _create_test_prescription(session, doctor_id, patient_id, status="ACTIVE", m
 class TestBulkRevocation:
     """Test bulk revocation operations."""
     
-    def test_bulk_revoke_preview(self, test_session, doctor_user, patient_user):
+    def test_bulk_revoke_preview(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test bulk revoke preview mode - should not actually revoke."""
-        rx1 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        rx2 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx1 = prescription_factory()
+        rx2 = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         result = svc.revoke_bulk(
@@ -73,15 +87,14 @@ class TestBulkRevocation:
         assert "bulk_operation_id" in result
         
         # Verify prescriptions are NOT actually revoked
-        test_session.refresh(rx1)
-        test_session.refresh(rx2)
+        _refresh_many(test_session, rx1, rx2)
         assert rx1.status == "ACTIVE"
         assert rx2.status == "ACTIVE"
     
-    def test_bulk_revoke_execute(self, test_session, doctor_user, patient_user):
+    def test_bulk_revoke_execute(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test bulk revoke execution."""
-        rx1 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        rx2 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx1 = prescription_factory()
+        rx2 = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         result = svc.revoke_bulk(
@@ -97,16 +110,14 @@ class TestBulkRevocation:
         assert rx2.id in result["prescription_ids"]
         
         # Verify prescriptions ARE revoked
-        test_session.refresh(rx1)
-        test_session.refresh(rx2)
+        _refresh_many(test_session, rx1, rx2)
         assert rx1.status == "REVOKED"
         assert rx2.status == "REVOKED"
     
-    def test_bulk_revoke_max_100_limit(self, test_session, doctor_user, patient_user):
+    def test_bulk_revoke_max_100_limit(self, test_session, doctor_user, patient_user, prescriptions_factory):
         """Test that bulk revoke is limited to 100 prescriptions."""
         # Create 101 prescriptions
-        for i in range(101):
-            _create_test_prescription(test_session, doctor_user.id, patient_user.id, medication_name=f"Med{i}")
+        prescriptions_factory([{"medication_name": f"Med{i}"} for i in range(101)])
         
         svc = RevocationService(db_session=test_session)
         
@@ -117,10 +128,36 @@ class TestBulkRevocation:
                 actor_id=doctor_user.id
             )
     
-    def test_bulk_revoke_filter_by_medication(self, test_session, doctor_user, patient_user):
+    def test_bulk_revoke_overflow_keeps_caller_work(self, test_session, doctor_user, patient_user, prescriptions_factory):
+        """An overflow undoes only the bulk UPDATE, not unrelated work pending in the caller's session."""
+        prescriptions = prescriptions_factory([{"medication_name": f"Med{i}"} for i in range(101)])
+        pending = Audit(
+            event_type="unrelated_work",
+            actor_id=doctor_user.id,
+            actor_role="doctor",
+            action="unrelated_work",
+            resource_type="prescription",
+            resource_id=prescriptions[0].id,
+        )
+        test_session.add(pending)
+        
+        svc = RevocationService(db_session=test_session)
+        with pytest.raises(ValueError, match="100 prescriptions maximum"):
+            svc.revoke_bulk(
+                filter_criteria={"patient_id": patient_user.id},
+                reason="test",
+                actor_id=doctor_user.id
+            )
+        
+        assert pending in test_session
+        assert test_session.get(Audit, pending.id) is pending
+        _refresh_many(test_session, *prescriptions)
+        assert {rx.status for rx in prescriptions} == {"ACTIVE"}
+    
+    def test_bulk_revoke_filter_by_medication(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test bulk revoke with medication name filter."""
-        rx1 = _create_test_prescription(test_session, doctor_user.id, patient_user.id, medication_name="Amoxicillin")
-        rx2 = _create_test_prescription(test_session, doctor_user.id, patient_user.id, medication_name="Ibuprofen")
+        rx1 = prescription_factory(medication_name="Amoxicillin")
+        rx2 = prescription_factory(medication_name="Ibuprofen")
         
         svc = RevocationService(db_session=test_session)
         result = svc.revoke_bulk(
@@ -133,14 +170,14 @@ class TestBulkRevocation:
         assert rx1.id in result["prescription_ids"]
         assert rx2.id not in result["prescription_ids"]
     
-    def test_bulk_revoke_filter_by_date_range(self, test_session, doctor_user, patient_user):
+    def test_bulk_revoke_filter_by_date_range(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test bulk revoke with date range filter."""
         # Create prescription with specific date
-        rx1 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx1 = prescription_factory()
         rx1.date_issued = datetime.now(SAST) - timedelta(days=5)
         test_session.commit()
         
-        rx2 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx2 = prescription_factory()
         rx2.date_issued = datetime.now(SAST) - timedelta(days=20)
         test_session.commit()
         
@@ -160,6 +197,37 @@ class TestBulkRevocation:
         # Should only include rx1 (5 days ago), not rx2 (20 days ago)
         assert result["affected_count"] == 1
         assert rx1.id in result["prescription_ids"]
+    
+    @pytest.mark.parametrize(
+        "date_range,included",
+        [
+            # Same-day bounds around 08:00 UTC (10:00 SAST)
+            ({"start": "2026-02-12T09:00:00+02:00"}, True),
+            ({"start": "2026-02-12T11:00:00+02:00"}, False),
+            ({"end": "2026-02-12T11:00:00+02:00"}, True),
+            ({"end": "2026-02-12T09:00:00+02:00"}, False),
+            # Naive bounds are already UTC
+            ({"start": "2026-02-12T07:59:00", "end": "2026-02-12T08:01:00"}, True),
+        ],
+        ids=["start_before", "start_after", "end_after", "end_before", "naive_utc"],
+    )
+    def test_date_range_bounds_on_boundary_day(self, test_session, doctor_user, patient_user, date_range, included, prescription_factory):
+        """Bounds on the row's own day are compared as instants, not text.
+        
+        date_issued is stored as naive UTC; aware bounds are converted to UTC
+        before comparing, in both the bulk selector and the impact analysis.
+        """
+        rx = prescription_factory(
+            date_issued=datetime(2026, 2, 12, 8, 0), date_expires=datetime(2026, 5, 13, 8, 0)
+        )
+        filter_criteria = {"patient_id": patient_user.id, "date_range": date_range}
+        svc = RevocationService(db_session=test_session)
+        
+        impact = svc.analyze_bulk_impact(filter_criteria=filter_criteria)
+        assert impact["total_count"] == (1 if included else 0)
+        
+        result = svc.revoke_bulk(filter_criteria=filter_criteria, reason="test", actor_id=doctor_user.id)
+        assert (rx.id in result["prescription_ids"]) is included
 
 
 # ============================================================================
@@ -171,10 +239,10 @@ class TestBulkRollback:
     """Test bulk rollback operations."""
     
     @freeze_time("2026-02-12 10:00:00+02:00")
-    def test_rollback_bulk_success(self, test_session, doctor_user, patient_user):
+    def test_rollback_bulk_success(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test successful rollback within 24 hours."""
-        rx1 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        rx2 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx1 = prescription_factory()
+        rx2 = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         
@@ -198,15 +266,14 @@ class TestBulkRollback:
         assert rollback_result["restored_count"] == 2
         
         # Verify restored
-        test_session.refresh(rx1)
-        test_session.refresh(rx2)
+        _refresh_many(test_session, rx1, rx2)
         assert rx1.status == "ACTIVE"
         assert rx2.status == "ACTIVE"
     
     @freeze_time("2026-02-12 10:00:00+02:00")
-    def test_rollback_after_24_hours_fails(self, test_session, doctor_user, patient_user):
+    def test_rollback_after_24_hours_fails(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test rollback fails after 24 hour window."""
-        rx1 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx1 = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         
@@ -240,9 +307,9 @@ class TestBulkRollback:
 class TestScheduledRevocation:
     """Test scheduled revocation operations."""
     
-    def test_schedule_revocation_success(self, test_session, doctor_user, patient_user):
+    def test_schedule_revocation_success(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test scheduling a future revocation."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         scheduled_time = datetime.now(SAST) + timedelta(days=7)
@@ -271,9 +338,9 @@ class TestScheduledRevocation:
                 actor_id=doctor_user.id
             )
     
-    def test_cancel_scheduled_revocation(self, test_session, doctor_user, patient_user):
+    def test_cancel_scheduled_revocation(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test canceling a scheduled revocation."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         scheduled_time = datetime.now(SAST) + timedelta(days=7)
@@ -294,9 +361,9 @@ class TestScheduledRevocation:
         assert cancel_result["success"] is True
         assert cancel_result["schedule_id"] == schedule_id
     
-    def test_cancel_already_cancelled_fails(self, test_session, doctor_user, patient_user):
+    def test_cancel_already_cancelled_fails(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test canceling an already cancelled schedule fails."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         
@@ -317,9 +384,9 @@ class TestScheduledRevocation:
         with pytest.raises(ValueError, match="already cancelled"):
             svc.cancel_scheduled_revocation(schedule_id, actor_id=doctor_user.id)
     
-    def test_get_scheduled_revocations(self, test_session, doctor_user, patient_user):
+    def test_get_scheduled_revocations(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test listing scheduled revocations."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         
@@ -347,9 +414,9 @@ class TestScheduledRevocation:
         assert "test2" in reasons
     
     @freeze_time("2026-02-12 10:00:00+02:00")
-    def test_process_due_revocations(self, test_session, doctor_user, patient_user):
+    def test_process_due_revocations(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test processing due scheduled revocations."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         
@@ -398,10 +465,10 @@ class TestConditionalRevocationRules:
         assert result["conditions"]["auto_revoke"] is True
         assert result["reason"] == "auto_expired"
     
-    def test_evaluate_expiry_rule(self, test_session, doctor_user, patient_user):
+    def test_evaluate_expiry_rule(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test evaluating expiry rule against expired prescription."""
         # Create expired prescription
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         rx.date_expires = datetime.now(SAST) - timedelta(days=1)  # Expired yesterday
         test_session.commit()
         
@@ -421,12 +488,9 @@ class TestConditionalRevocationRules:
         assert len(triggered) >= 1
         assert any(t["trigger_type"] == "expiry" for t in triggered)
     
-    def test_evaluate_repeat_exhausted_rule(self, test_session, doctor_user, patient_user):
+    def test_evaluate_repeat_exhausted_rule(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test evaluating repeat exhausted rule."""
-        rx = _create_test_prescription(
-            test_session, doctor_user.id, patient_user.id,
-            is_repeat=True, repeat_count=3
-        )
+        rx = prescription_factory(is_repeat=True, repeat_count=3)
         
         svc = RevocationService(db_session=test_session)
         
@@ -444,10 +508,10 @@ class TestConditionalRevocationRules:
         assert len(triggered) >= 1
         assert any(t["trigger_type"] == "repeat_exhausted" for t in triggered)
     
-    def test_evaluate_time_based_rule(self, test_session, doctor_user, patient_user):
+    def test_evaluate_time_based_rule(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test evaluating time-based rule."""
         # Create prescription issued 60 days ago
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         rx.date_issued = datetime.now(SAST) - timedelta(days=60)
         test_session.commit()
         
@@ -476,9 +540,9 @@ class TestConditionalRevocationRules:
 class TestImpactAnalysis:
     """Test impact analysis functionality."""
     
-    def test_analyze_revocation_impact_active(self, test_session, doctor_user, patient_user):
+    def test_analyze_revocation_impact_active(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test impact analysis for active prescription."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         result = svc.analyze_revocation_impact(rx.id)
@@ -488,9 +552,9 @@ class TestImpactAnalysis:
         assert result["impact_level"] == "low"
         assert result["affected_entities"]["patient"] is True
     
-    def test_analyze_revocation_impact_already_revoked(self, test_session, doctor_user, patient_user):
+    def test_analyze_revocation_impact_already_revoked(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test impact analysis for already revoked prescription."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id, status="REVOKED")
+        rx = prescription_factory(status="REVOKED")
         
         svc = RevocationService(db_session=test_session)
         result = svc.analyze_revocation_impact(rx.id)
@@ -498,12 +562,9 @@ class TestImpactAnalysis:
         assert result["can_revoke"] is False
         assert "already revoked" in str(result["warnings"])
     
-    def test_analyze_revocation_impact_with_repeats(self, test_session, doctor_user, patient_user):
+    def test_analyze_revocation_impact_with_repeats(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test impact analysis for prescription with repeats."""
-        rx = _create_test_prescription(
-            test_session, doctor_user.id, patient_user.id,
-            is_repeat=True, repeat_count=2
-        )
+        rx = prescription_factory(is_repeat=True, repeat_count=2)
         
         svc = RevocationService(db_session=test_session)
         result = svc.analyze_revocation_impact(rx.id)
@@ -511,10 +572,9 @@ class TestImpactAnalysis:
         assert result["impact_level"] == "medium"
         assert any("repeat" in str(w).lower() for w in result["warnings"])
     
-    def test_analyze_bulk_impact(self, test_session, doctor_user, patient_user):
+    def test_analyze_bulk_impact(self, test_session, doctor_user, patient_user, prescriptions_factory):
         """Test bulk impact analysis."""
-        _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        prescriptions_factory([{}, {}])
         
         svc = RevocationService(db_session=test_session)
         result = svc.analyze_bulk_impact(
@@ -535,11 +595,11 @@ class TestImpactAnalysis:
 class TestDashboard:
     """Test dashboard statistics."""
     
-    def test_get_revocation_dashboard(self, test_session, doctor_user, patient_user):
+    def test_get_revocation_dashboard(self, test_session, doctor_user, patient_user, prescription_factory):
         """Test dashboard statistics generation."""
         # Create and revoke some prescriptions
-        rx1 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        rx2 = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx1 = prescription_factory()
+        rx2 = prescription_factory()
         
         svc = RevocationService(db_session=test_session)
         
@@ -558,10 +618,9 @@ class TestDashboard:
         assert "trends" in dashboard
         assert "recent_activity" in dashboard
     
-    def test_dashboard_with_bulk_revocation(self, test_session, doctor_user, patient_user):
+    def test_dashboard_with_bulk_revocation(self, test_session, doctor_user, patient_user, prescriptions_factory):
         """Test dashboard includes bulk revocations."""
-        _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        prescriptions_factory([{}, {}])
         
         svc = RevocationService(db_session=test_session)
         
@@ -588,22 +647,14 @@ class TestDashboard:
 class TestRevocationAPI:
     """Test FastAPI endpoints for revocation."""
     
-    async def test_api_revoke_prescription(self, async_client, doctor_user, patient_user, test_session):
+    async def test_api_revoke_prescription(self, async_client, doctor_user, patient_user, test_session, doctor_headers, prescription_factory):
         """Test API endpoint for single revocation."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        
-        from app.core.auth import create_access_token
-        token = create_access_token({
-            "sub": str(doctor_user.id),
-            "username": doctor_user.username,
-            "role": "doctor",
-            "tenant_id": "default"
-        })
+        rx = prescription_factory()
         
         response = await async_client.post(
             f"/api/v1/prescriptions/{rx.id}/revoke",
             json={"reason": "prescribing_error"},
-            headers={"Authorization": f"Bearer {token}"}
+            headers=doctor_headers
         )
         
         assert response.status_code == 200
@@ -611,18 +662,9 @@ class TestRevocationAPI:
         assert data["success"] is True
         assert data["reason"] == "prescribing_error"
     
-    async def test_api_bulk_revoke_preview(self, async_client, doctor_user, patient_user, test_session):
+    async def test_api_bulk_revoke_preview(self, async_client, doctor_user, patient_user, test_session, doctor_headers, prescriptions_factory):
         """Test API endpoint for bulk revoke preview."""
-        _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        
-        from app.core.auth import create_access_token
-        token = create_access_token({
-            "sub": str(doctor_user.id),
-            "username": doctor_user.username,
-            "role": "doctor",
-            "tenant_id": "default"
-        })
+        prescriptions_factory([{}, {}])
         
         response = await async_client.post(
             "/api/v1/prescriptions/bulk-revoke",
@@ -631,7 +673,7 @@ class TestRevocationAPI:
                 "reason": "test",
                 "preview_only": True
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=doctor_headers
         )
         
         assert response.status_code == 200
@@ -639,17 +681,9 @@ class TestRevocationAPI:
         assert data["preview"] is True
         assert data["affected_count"] >= 2
     
-    async def test_api_schedule_revocation(self, async_client, doctor_user, patient_user, test_session):
+    async def test_api_schedule_revocation(self, async_client, doctor_user, patient_user, test_session, doctor_headers, prescription_factory):
         """Test API endpoint for scheduling revocation."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        
-        from app.core.auth import create_access_token
-        token = create_access_token({
-            "sub": str(doctor_user.id),
-            "username": doctor_user.username,
-            "role": "doctor",
-            "tenant_id": "default"
-        })
+        rx = prescription_factory()
         
         scheduled_time = (datetime.now(SAST) + timedelta(days=7)).isoformat()
         
@@ -660,7 +694,7 @@ class TestRevocationAPI:
                 "scheduled_at": scheduled_time,
                 "reason": "future_expiry"
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=doctor_headers
         )
         
         assert response.status_code == 201
@@ -668,25 +702,17 @@ class TestRevocationAPI:
         assert data["prescription_id"] == rx.id
         assert data["status"] == "scheduled"
     
-    async def test_api_get_revocations_list(self, async_client, doctor_user, patient_user, test_session):
+    async def test_api_get_revocations_list(self, async_client, doctor_user, patient_user, test_session, doctor_headers, prescription_factory):
         """Test API endpoint for listing revocations."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
+        rx = prescription_factory()
         
         # Revoke it first
         svc = RevocationService(db_session=test_session)
         svc.revoke_prescription(rx.id, doctor_user.id, "test")
         
-        from app.core.auth import create_access_token
-        token = create_access_token({
-            "sub": str(doctor_user.id),
-            "username": doctor_user.username,
-            "role": "doctor",
-            "tenant_id": "default"
-        })
-        
         response = await async_client.get(
             "/api/v1/prescriptions/revocations",
-            headers={"Authorization": f"Bearer {token}"}
+            headers=doctor_headers
         )
         
         assert response.status_code == 200
@@ -694,21 +720,13 @@ class TestRevocationAPI:
         assert isinstance(data, list)
         assert len(data) >= 1
     
-    async def test_api_analyze_impact(self, async_client, doctor_user, patient_user, test_session):
+    async def test_api_analyze_impact(self, async_client, doctor_user, patient_user, test_session, doctor_headers, prescription_factory):
         """Test API endpoint for impact analysis."""
-        rx = _create_test_prescription(test_session, doctor_user.id, patient_user.id)
-        
-        from app.core.auth import create_access_token
-        token = create_access_token({
-            "sub": str(doctor_user.id),
-            "username": doctor_user.username,
-            "role": "doctor",
-            "tenant_id": "default"
-        })
+        rx = prescription_factory()
         
         response = await async_client.get(
             f"/api/v1/prescriptions/{rx.id}/revoke-impact",
-            headers={"Authorization": f"Bearer {token}"}
+            headers=doctor_headers
         )
         
         assert response.status_code == 200
@@ -717,21 +735,12 @@ class TestRevocationAPI:
         assert "can_revoke" in data
         assert "impact_level" in data
     
-    async def test_api_dashboard_admin_only(self, async_client, doctor_user, patient_user, test_session):
+    async def test_api_dashboard_admin_only(self, async_client, doctor_user, patient_user, test_session, doctor_headers):
         """Test dashboard endpoint requires admin role."""
-        from app.core.auth import create_access_token
-        
         # Doctor token should be denied
-        doctor_token = create_access_token({
-            "sub": str(doctor_user.id),
-            "username": doctor_user.username,
-            "role": "doctor",
-            "tenant_id": "default"
-        })
-        
         response = await async_client.get(
             "/api/v1/admin/revocations/dashboard",
-            headers={"Authorization": f"Bearer {doctor_token}"}
+            headers=doctor_headers
         )
         
         assert response.status_code == 403
@@ -49,6 +49,9 @@ import pytest
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 
+from app.main import app
+from app.models.prescription import Prescription
+
 
 # ============================================================================
 # FIXTURES
@@ -69,8 +72,6 @@ def test_client(
 
     Will fail until app has verification routes.
     """
-    from app.main import app
-
     return TestClient(app)
 
 
@@ -204,8 +205,6 @@ async def test_verify_valid_signed_prescription(
         "verified_at": "2026-02-11T16:45:00Z"
     }
     """
-    from app.models.prescription import Prescription
-
     # Create and sign a prescription
     prescription = Prescription(
         doctor_id=doctor_user.id,
@@ -262,8 +261,6 @@ async def test_verify_invalid_signature(
         "error": "Invalid signature"
     }
     """
-    from app.models.prescription import Prescription
-
     # Create prescription with INVALID signature
     prescription = Prescription(
         doctor_id=doctor_user.id,
@@ -304,8 +301,6 @@ async def test_verify_unsigned_prescription(
 
     Expected response: 400 or 200 with verified=false
     """
-    from app.models.prescription import Prescription
-
     # Create UNSIGNED prescription (no digital_signature field)
     prescription = Prescription(
         doctor_id=doctor_user.id,
@@ -350,8 +345,6 @@ async def test_verify_tampered_prescription(
     - After retrieval: quantity=5 (modified)
     - Signature was for original data → verification fails
     """
-    from app.models.prescription import Prescription
-
     # Create prescription with valid signature for specific data
     prescription = Prescription(
         doctor_id=doctor_user.id,
@@ -413,8 +406,6 @@ async def test_verify_unauthenticated(test_client, test_session, doctor_user, pa
 
     Expected response: 401 Unauthorized (no auth header)
     """
-    from app.models.prescription import Prescription
-
     # Create a prescription
     prescription = Prescription(
         doctor_id=doctor_user.id,
@@ -463,8 +454,6 @@ async def test_verify_checks_doctor_did_in_trust_registry(
     - If found: checks.doctor_trusted = true
     - If not found: checks.doctor_trusted = false
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -508,8 +497,6 @@ async def test_verify_untrusted_doctor_did(
     - This DID is NOT in TRUSTED_DOCTOR_DIDS mock registry
     - Expected: checks.doctor_trusted = false
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -553,8 +540,6 @@ async def test_verify_trust_registry_unavailable(
     - Service returns verified=false or error message
     - OR includes "doctor_trusted": null/unknown
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -602,8 +587,6 @@ async def test_verify_checks_revocation_status(
     - For MVP: mock always returns not_revoked=true
     - checks.not_revoked boolean field
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -647,8 +630,6 @@ async def test_verify_revoked_prescription(
     - Credential credential_id is marked revoked in registry
     - Verification fails: verified=false, checks.not_revoked=false
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -692,8 +673,6 @@ async def test_verify_revocation_registry_unavailable(
     - Service returns verified=false or error
     - OR includes "not_revoked": null/unknown
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -742,8 +721,6 @@ async def test_verify_complete_flow_success(
     3. Revocation check: credential not revoked ✓
     → Result: verified=true
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -790,8 +767,6 @@ async def test_verify_complete_flow_failure(
     - Revocation: not revoked
     → Result: verified=false (ANY check failing = fail)
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -844,8 +819,6 @@ async def test_verify_doctor_can_verify(
     - Doctor can call GET /api/v1/prescriptions/{id}/verify
     - Returns verification result (not 403 Forbidden)
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -886,8 +859,6 @@ async def test_verify_patient_can_verify(
     - Patient can call GET /api/v1/prescriptions/{id}/verify
     - Returns verification result (not 403 Forbidden)
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -928,8 +899,6 @@ async def test_verify_pharmacist_can_verify(
     - Primary use case for verification
     - Returns verification result
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -981,8 +950,6 @@ async def test_verify_all_roles_can_verify(
 
     No role-based restriction - all authenticated users have access.
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -1059,8 +1026,6 @@ async def test_verify_error_malformed_auth_header(
 
     Expected response: 401 Unauthorized
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -1099,8 +1064,6 @@ async def test_verify_response_includes_timestamps(
 
     Expected response field: "verified_at" (ISO 8601 timestamp)
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -1141,8 +1104,6 @@ async def test_verify_prescription_idempotent(
 
     Calling verify multiple times should return same result.
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -1196,8 +1157,6 @@ async def test_verify_prescription_consistency_across_users(
 
     Verification should be deterministic regardless of who verifies.
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,
@@ -1236,11 +1195,6 @@ async def test_verify_prescription_consistency_across_users(
         assert doctor_data.get("verified") == patient_data.get("verified")
 
 
-def test_pytest_collection_verify():
-    """Verify pytest can collect all verification tests."""
-    assert True
-
-
 @pytest.mark.asyncio
 async def test_verify_prescription_complete_end_to_end_flow(
     test_client,
@@ -1261,8 +1215,6 @@ async def test_verify_prescription_complete_end_to_end_flow(
     3. Pharmacist verifies before dispensing
     All should succeed (or all fail consistently in TDD)
     """
-    from app.models.prescription import Prescription
-
     prescription = Prescription(
         doctor_id=doctor_user.id,
         patient_id=patient_user.id,